@@ -3,11 +3,17 @@ Test that EBA samples are transformed correctly
 """
 
 import unittest
+from io import BytesIO
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
 
+from lxml import etree
 from test_samples_base import (TestInstanceConversionBasic,
                                                TestInstanceConversionFull)
 
+from xbridge.api import convert_instance
+
 
 INPUT_PATH_3_2p1 = Path(__file__).parent / "test_files" / "sample_3_2_phase1"
 INPUT_PATH_3_2p3 = Path(__file__).parent / "test_files" / "sample_3_2_phase3"
@@ -19,57 +25,60 @@ class TestCase1(TestInstanceConversionFull):
     File 1
     """
 
-    def setUp(self):
-        super().setUp(
-            instance_path=INPUT_PATH_3_2p3 / "test1_in.xbrl",
-            expected_output_path=INPUT_PATH_3_2p3 / "test1_out.zip",
-        )
+    instance_path = INPUT_PATH_3_2p3 / "test1_in.xbrl"
+    expected_output_path = INPUT_PATH_3_2p3 / "test1_out.zip"
 
 
 class TestCase2(TestInstanceConversionBasic):
-    def setUp(self):
-        super().setUp(
-            instance_path=INPUT_PATH_3_2p3 / "test2_in.xbrl",
-            expected_output_path=INPUT_PATH_3_2p3 / "test2_out.zip",
-        )
+    instance_path = INPUT_PATH_3_2p3 / "test2_in.xbrl"
+    expected_output_path = INPUT_PATH_3_2p3 / "test2_out.zip"
 
 
 class TestCase3(TestInstanceConversionFull):
-    def setUp(self):
-        super().setUp(
-            instance_path=INPUT_PATH_3_2p3 / "test3_in.xbrl",
-            expected_output_path=INPUT_PATH_3_2p3 / "test3_out.zip",
-        )
+    instance_path = INPUT_PATH_3_2p3 / "test3_in.xbrl"
+    expected_output_path = INPUT_PATH_3_2p3 / "test3_out.zip"
 
 
 class TestCase4(TestInstanceConversionFull):
-    def setUp(self):
-        super().setUp(
-            instance_path=INPUT_PATH_3_2p3 / "test4_in.xbrl",
-            expected_output_path=INPUT_PATH_3_2p3 / "test4_out.zip",
-        )
+    instance_path = INPUT_PATH_3_2p3 / "test4_in.xbrl"
+    expected_output_path = INPUT_PATH_3_2p3 / "test4_out.zip"
 
 
 class TestCase5(TestInstanceConversionBasic):
-    def setUp(self):
-        super().setUp(
-            instance_path=INPUT_PATH_3_2p3 / "test5_in.xbrl",
-            expected_output_path=INPUT_PATH_3_2p3 / "test5_out.zip",
-        )
+    instance_path = INPUT_PATH_3_2p3 / "test5_in.xbrl"
+    expected_output_path = INPUT_PATH_3_2p3 / "test5_out.zip"
 
 
 class TestCase6(TestInstanceConversionBasic):
-    def setUp(self):
-        super().setUp(
-            instance_path=INPUT_PATH_3_3 / "test1_in.xbrl",
-            expected_output_path=INPUT_PATH_3_3 / "test1_out.zip",
-        )
+    instance_path = INPUT_PATH_3_3 / "test1_in.xbrl"
+    expected_output_path = INPUT_PATH_3_3 / "test1_out.zip"
 
 class TestCase7(TestInstanceConversionBasic):
-    def setUp(self):
-        super().setUp(
-            instance_path=INPUT_PATH_3_2p1 / "test1_in.xbrl",
-            expected_output_path=INPUT_PATH_3_2p1 / "test1_out.zip",
+    instance_path = INPUT_PATH_3_2p1 / "test1_in.xbrl"
+    expected_output_path = INPUT_PATH_3_2p1 / "test1_out.zip"
+
+class TestInstanceWithoutFacts(unittest.TestCase):
+    """
+    Instance with filing indicators but without any fact
+    """
+
+    def test_only_header_files(self):
+        tree = etree.parse(INPUT_PATH_3_2p3 / "test1_in.xbrl")
+        root = tree.getroot()
+        metric_prefix = "{http://www.eba.europa.eu/xbrl/crr/dict/met}"
+        for child in list(root):
+            if isinstance(child.tag, str) and child.tag.startswith(metric_prefix):
+                root.remove(child)
+
+        with TemporaryDirectory() as output_dir:
+            output_path = convert_instance(BytesIO(etree.tostring(tree)), output_dir)
+            with ZipFile(output_path) as zip_fl:
+                csv_files = {
+                    file for file in zip_fl.namelist() if file.endswith(".csv")
+                }
+
+        self.assertEqual(
+            csv_files, {"reports/FilingIndicators.csv", "reports/parameters.csv"}
         )
 
 if __name__ == "__main__":
@@ -5,60 +5,69 @@ Test that EBA samples are transformed correctly
 import json
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from zipfile import ZipFile
 
 import pandas as pd
 
 from xbridge.api import convert_instance, load_instance
 
-OUTPUT_PATH = Path(__file__).parent / "conversions"
-
 
 class TestInstanceConversionBasic(unittest.TestCase):
     """
     Tests for the cases where only input xml is provided
     """
 
-    def setUp(self, instance_path=None, expected_output_path=None):
+    instance_path = None
+    expected_output_path = None
+
+    @classmethod
+    def setUpClass(cls):
         """
-        Sets up the test case
+        Sets up the test case. The conversion is done once per class
+        and shared by all the tests
         """
-        if instance_path is None:
-            self.skipTest("Abstract test class")
+        if cls.instance_path is None:
+            raise unittest.SkipTest("Abstract test class")
 
-        self.instance = load_instance(instance_path)
+        cls.instance = load_instance(cls.instance_path)
 
+        # Each class writes to its own directory, as several samples share
+        # the same file name and the classes may run in parallel
+        cls.output_dir = TemporaryDirectory()
         generated_output_path = convert_instance(
-            instance_path=instance_path, output_path=OUTPUT_PATH
+            instance_path=cls.instance, output_path=cls.output_dir.name
         )
-        self.generated_output_path = Path(generated_output_path)
-        self.input_path = Path(instance_path)
-        self.generated_output_zip = ZipFile(generated_output_path, mode="r")
-        self.generated_csv_files = [
+        cls.generated_output_path = Path(generated_output_path)
+        cls.input_path = Path(cls.instance_path)
+        cls.generated_output_zip = ZipFile(generated_output_path, mode="r")
+        cls.generated_file_names = set(cls.generated_output_zip.namelist())
+        cls.generated_csv_files = [
             file
-            for file in self.generated_output_zip.namelist()
+            for file in cls.generated_file_names
             if file.startswith("reports") and file.endswith(".csv")
         ]
 
-        self.no_xml_facts = len(self.instance.facts)
-        self.no_filing_indicators = len(self.instance.filing_indicators)
+        cls.no_xml_facts = len(cls.instance.facts)
+        cls.no_filing_indicators = len(cls.instance.filing_indicators)
 
-        self.expected_output_zip = ZipFile(expected_output_path, mode="r")
-        self.expected_root_folder_name = self.expected_output_zip.namelist()[0]
-        self.expected_csv_files = [
+        cls.expected_output_zip = ZipFile(cls.expected_output_path, mode="r")
+        cls.expected_root_folder_name = cls.expected_output_zip.namelist()[0]
+        cls.expected_csv_files = [
             file
-            for file in self.expected_output_zip.namelist()
-            if file.startswith(f"{self.expected_root_folder_name}reports")
+            for file in cls.expected_output_zip.namelist()
+            if file.startswith(f"{cls.expected_root_folder_name}reports")
             and file.endswith(".csv")
         ]
 
-    def tearDown(self) -> None:
+    @classmethod
+    def tearDownClass(cls) -> None:
         """
         Removes the generated zip file
         """
-        self.generated_output_zip.close()
-        self.generated_output_path.unlink()
-        self.expected_output_zip.close()
+        cls.generated_output_zip.close()
+        cls.expected_output_zip.close()
+        cls.output_dir.cleanup()
 
     def test_file_created(self):
         """Asserts that the file is created"""
@@ -69,8 +78,8 @@ class TestInstanceConversionBasic(unittest.TestCase):
         Asserts that the file has the structure of an XBRL-CSV file
         Concretely, it contains the standard folders and json files
         """
-        self.assertTrue("reports/report.json" in self.generated_output_zip.namelist())
-        self.assertTrue("META-INF/reports.json" in self.generated_output_zip.namelist())
+        self.assertIn("reports/report.json", self.generated_file_names)
+        self.assertIn("META-INF/reports.json", self.generated_file_names)
 
     def test_number_facts(self):
         """
@@ -104,10 +113,11 @@ class TestInstanceConversionBasic(unittest.TestCase):
         for expected_file in self.expected_csv_files:
             file_name = Path(expected_file).name
 
+            # Only the header row is needed to compare the structure
             with self.expected_output_zip.open(expected_file) as fl:
-                expected_df = pd.read_csv(fl)
+                expected_df = pd.read_csv(fl, nrows=0)
             with self.generated_output_zip.open(f"reports/{file_name}") as fl:
-                generated_df = pd.read_csv(fl)
+                generated_df = pd.read_csv(fl, nrows=0)
 
             self.assertTrue(
                 set(list(expected_df.columns)) == set(list(generated_df.columns)),
@@ -124,17 +134,6 @@ class TestInstanceConversionFull(TestInstanceConversionBasic):
     csv files are provided
     """
 
-    def setUp(self, instance_path=None, expected_output_path=None):
-        """
-        Sets up the test case
-        :param instance_path: Path to the input xml file
-        :param expected_output_path: Path to the expected output zip file
-        """
-        super().setUp(instance_path, expected_output_path)
-
-    def tearDown(self) -> None:
-        super().tearDown()
-
     def test_reports_file(self):
         """
         Tests that the META-INFO/reports.json file is equal in
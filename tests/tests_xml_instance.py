@@ -3,8 +3,13 @@ Tests for xml_instance module
 """
 
 import unittest
+from io import BytesIO
+from pathlib import Path
+
 from lxml import etree
-from xbridge.xml_instance import FilingIndicator, Fact
+from xbridge.xml_instance import FilingIndicator, Fact, Instance, _max_decimals
+
+SAMPLE_PATH = Path(__file__).parent / "test_files" / "sample_3_3" / "test1_in.xbrl"
 
 
 class TestFilingIndicator(unittest.TestCase):
@@ -61,6 +66,17 @@ class TestFact(unittest.TestCase):
         }
         self.assertDictEqual(self.fact.__dict__(), expected_dict)
 
+    def test_shared_strings(self):
+        other_xml = etree.Element(
+            "{http://www.xbrl.org/2003/instance}fact",
+            attrib={"decimals": "2", "contextRef": "context1", "unitRef": "unit1"},
+        )
+        other_fact = Fact(other_xml)
+        self.assertIs(other_fact.metric, self.fact.metric)
+        self.assertIs(other_fact.context, self.fact.context)
+        self.assertIs(other_fact.unit, self.fact.unit)
+        self.assertIs(other_fact.__dict__()["metric"], self.fact.__dict__()["metric"])
+
     def test_repr(self):
         expected_repr = (
             f"Fact(metric={self.fact.metric}, value=100, "
@@ -69,5 +85,31 @@ class TestFact(unittest.TestCase):
         self.assertEqual(repr(self.fact), expected_repr)
 
 
+class TestMaxDecimals(unittest.TestCase):
+    def test_numeric_comparison(self):
+        self.assertEqual(_max_decimals({"2", "10"}), 10)
+        self.assertEqual(_max_decimals({"-3", "-6"}), -3)
+
+    def test_zero(self):
+        self.assertEqual(_max_decimals({"0", "-2"}), 0)
+
+    def test_ignores_inf_and_missing(self):
+        self.assertEqual(_max_decimals({"INF", None, "4"}), 4)
+
+    def test_empty(self):
+        self.assertIsNone(_max_decimals(set()))
+        self.assertIsNone(_max_decimals({"INF"}))
+
+
+class TestInstanceFromFileObject(unittest.TestCase):
+    def test_same_as_path(self):
+        from_path = Instance(SAMPLE_PATH)
+        from_bytes = Instance(BytesIO(SAMPLE_PATH.read_bytes()))
+
+        self.assertEqual(from_bytes.module_ref, from_path.module_ref)
+        self.assertEqual(len(from_bytes.facts), len(from_path.facts))
+        self.assertTrue(from_bytes.instance_df.equals(from_path.instance_df))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,16 +1,21 @@
 """API module."""
 
 from pathlib import Path
+from typing import BinaryIO
 
 from xbridge.converter import Converter
 from xbridge.xml_instance import Instance
 
 
-def convert_instance(instance_path: str, output_path: str | Path = None):
+def convert_instance(
+    instance_path: str | Path | BinaryIO | Instance, output_path: str | Path = None
+):
     """
     Convert one single instance of XBRL-XML file to a CSV file
 
-    :param instance_path: Path to the XBRL-XML instance
+    :param instance_path: Path to the XBRL-XML instance, a binary file-like object
+        with its content (e.g. ``io.BytesIO``) or an :obj:`instance <xbridge.xml_instance.Instance>`
+        already loaded with :func:`load_instance`
 
     :param output_path: Path to the output CSV file
 
@@ -22,11 +27,12 @@ def convert_instance(instance_path: str, output_path: str | Path = None):
     return converter.convert(output_path)
 
 
-def load_instance(instance_path: str | Path) -> Instance:
+def load_instance(instance_path: str | Path | BinaryIO) -> Instance:
     """
     Load an XBRL XML instance file
 
-    :param instance_path: Path to the instance XBRL file
+    :param instance_path: Path to the instance XBRL file, or a binary file-like object
+        with its content
 
     :return: An instance object may be return
     """
@@ -5,9 +5,11 @@ taking as input the taxonomy object and the instance object
 
 import copy
 import csv
+import io
 import json
+from functools import lru_cache
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from typing import BinaryIO
 from zipfile import ZipFile
 
 import pandas as pd
@@ -28,6 +30,23 @@ if not INDEX_FILE.exists():
 with open(INDEX_FILE, "r", encoding="utf-8") as fl:
     index = json.load(fl)
 
+with open(MAPPING_FILE, "r", encoding="utf-8") as fl:
+    mapping = json.load(fl)
+
+# Values of the reported column of FilingIndicators.csv
+_BOOL_STR = {True: "true", False: "false"}
+
+
+@lru_cache(maxsize=8)
+def _load_module(module_path: Path) -> Module:
+    """Returns the :obj:`module <xbridge.modules.Module>` stored in the given JSON file.
+
+    Modules are cached, as converting several instances of the same module
+    would otherwise load and prepare the same tables again. The converter
+    does not modify the modules, so they can be safely shared.
+    """
+    return Module.from_serialized(module_path)
+
 
 class Converter:
     """
@@ -41,16 +60,20 @@ class Converter:
 
     """
 
-    def __init__(self, instance_path: str | Path) -> None:
-        self.instance = Instance(instance_path)
+    def __init__(self, instance_path: str | Path | BinaryIO | Instance) -> None:
+        # An already loaded instance is used as is, to avoid parsing it again
+        if isinstance(instance_path, Instance):
+            self.instance = instance_path
+        else:
+            self.instance = Instance(instance_path)
         module_ref = self.instance.module_ref
 
         if module_ref not in index:
             raise ValueError(f"Module {module_ref} not found in the taxonomy index")
 
         module_path = Path(__file__).parent / "modules" / index[module_ref]
-        self.module = Module.from_serialized(module_path)
-        self._reported_tables = []
+        self.module = _load_module(module_path)
+        self._reported_tables = set()
 
     def convert(self, output_path: str | Path) -> Path:
         """
@@ -67,44 +90,12 @@ class Converter:
         if self.module is None:
             raise ValueError("Module of the instance file not found in the taxonomy")
 
-        temp_dir = TemporaryDirectory()
-        temp_dir_path = Path(temp_dir.name)
-
-        meta_inf_dir = temp_dir_path / "META-INF"
-        report_dir = temp_dir_path / "reports"
-
-        meta_inf_dir.mkdir()
-        report_dir.mkdir()
-
-        with open(meta_inf_dir / "reports.json", "w", encoding="UTF-8") as fl:
-            json.dump(
-                {
-                    "documentInfo": {
-                        "documentType": "http://xbrl.org/PWD/2020-12-09/report-package"
-                    }
-                },
-                fl,
-            )
-
-        with open(report_dir / "report.json", "w", encoding="UTF-8") as fl:
-            json.dump(
-                {
-                    "documentInfo": {
-                        "documentType": "https://xbrl.org/CR/2021-02-03/xbrl-csv",
-                        "extends": [self.module.url],
-                    }
-                },
-                fl,
-            )
-
-        self._convert_filing_indicator(report_dir)
-        with open(MAPPING_FILE, "r", encoding="utf-8") as fl:
-            mapping_dict = json.load(fl)
-        self._convert_tables(report_dir, mapping_dict)
-        self._convert_parameters(report_dir)
-
         instance_path = self.instance.path
 
+        if not isinstance(instance_path, (str, Path)):
+            # File-like objects are named after the file they wrap, if any
+            instance_path = getattr(instance_path, "name", "instance")
+
         if not isinstance(instance_path, str):
             instance_path = str(instance_path)
 
@@ -119,13 +110,39 @@ class Converter:
 
         zip_file_path = output_path / file_name
 
-        with ZipFile(zip_file_path, "w") as zip_fl:
-            for file in meta_inf_dir.iterdir():
-                zip_fl.write(file, arcname=f"META-INF/{file.name}")
-            for file in report_dir.iterdir():
-                zip_fl.write(file, arcname=f"reports/{file.name}")
-
-        temp_dir.cleanup()
+        # The files are written straight into the package, without
+        # staging them in a temporary directory
+        try:
+            with ZipFile(zip_file_path, "w") as zip_fl:
+                zip_fl.writestr(
+                    "META-INF/reports.json",
+                    json.dumps(
+                        {
+                            "documentInfo": {
+                                "documentType": "http://xbrl.org/PWD/2020-12-09/report-package"
+                            }
+                        }
+                    ),
+                )
+
+                zip_fl.writestr(
+                    "reports/report.json",
+                    json.dumps(
+                        {
+                            "documentInfo": {
+                                "documentType": "https://xbrl.org/CR/2021-02-03/xbrl-csv",
+                                "extends": [self.module.url],
+                            }
+                        }
+                    ),
+                )
+
+                self._convert_filing_indicator(zip_fl)
+                self._convert_tables(zip_fl, mapping)
+                self._convert_parameters(zip_fl)
+        except Exception:
+            zip_file_path.unlink(missing_ok=True)
+            raise
 
         return zip_file_path
 
@@ -150,18 +167,19 @@ class Converter:
         not_relevant_dims = instance_columns - variable_columns - open_keys - attributes
         not_relevant_dims = not_relevant_dims - {"value", "unit", "decimals"}
 
-        instance_df = copy.copy(self.instance.instance_df)
-        for col in ["unit", "decimals"]:
-            if col not in attributes and col in instance_df.columns:
-                del instance_df[col]
-
         # Drop datapoints that have non-null values in not relevant dimensions
-        # And drop the not relevant columns
-        instance_df = instance_df[
-            instance_df[list(not_relevant_dims)].isnull().all(axis=1)
-        ]
-        for dim in not_relevant_dims:
-            del instance_df[dim]
+        # And drop the not relevant columns (and the unit and decimals if they
+        # are not attributes of the table). Both filters are applied in a single
+        # selection, so the instance dataframe is never copied as a whole
+        instance_df = self.instance.instance_df
+        dropped_cols = not_relevant_dims | ({"unit", "decimals"} - attributes)
+        kept_cols = [col for col in instance_df.columns if col not in dropped_cols]
+        rows = instance_df[list(not_relevant_dims)].isnull().all(axis=1)
+        # Only the facts of the metrics used in the table can match a datapoint,
+        # so the rest are discarded before the join
+        if "metric" in variable_columns and "metric" in instance_columns:
+            rows &= instance_df["metric"].isin(table.metrics)
+        instance_df = instance_df.loc[rows, kept_cols]
 
         # Do the intersection and drop from datapoints the columns and records
         intersect_cols = variable_columns & instance_columns
@@ -192,7 +210,18 @@ class Converter:
 
         return table_df
 
-    def _convert_tables(self, temp_dir_path, mapping_dict):
+    @staticmethod
+    def _open_report_file(zip_fl: ZipFile, file_name: str):
+        """Opens a text file for writing inside the reports folder of the package"""
+        return io.TextIOWrapper(
+            zip_fl.open(f"reports/{file_name}", "w"), encoding="utf-8", newline=""
+        )
+
+    def _convert_tables(self, zip_fl, mapping_dict):
+        # Without facts or reported tables, no table can have datapoints
+        if not self._reported_tables or self.instance.instance_df.empty:
+            return
+
         for table in self.module.tables:
             ##Workaround:
             # To calculate the table code for abstract tables, we look whether the name
@@ -219,30 +248,27 @@ class Converter:
                 if dim_name and not datapoints.empty:
                     datapoints[open_key] = dim_name + ":" + datapoints[open_key].astype(str)
             datapoints = datapoints.sort_values(by=["datapoint"], ascending=True)
-            output_path_table = temp_dir_path / table.url           
             if datapoints.empty:
                 continue
-            datapoints.to_csv(output_path_table, index=False)
+            with self._open_report_file(zip_fl, table.url) as fl:
+                datapoints.to_csv(fl, index=False)
 
-    def _convert_filing_indicator(self, temp_dir_path):
+    def _convert_filing_indicator(self, zip_fl):
         # Workaround;
         # Developed for the EBA structure
-        output_path_fi = temp_dir_path / "FilingIndicators.csv"
         filing_indicators = self.instance.filing_indicators
 
-        with open(output_path_fi, "w", newline="", encoding="utf-8") as fl:
+        with self._open_report_file(zip_fl, "FilingIndicators.csv") as fl:
             csv_writer = csv.writer(fl)
             csv_writer.writerow(["templateID", "reported"])
             for fil_ind in filing_indicators:
-                value = "true" if fil_ind.value else "false"
-                csv_writer.writerow([fil_ind.table, value])
+                csv_writer.writerow([fil_ind.table, _BOOL_STR[fil_ind.value]])
                 if fil_ind.value:
-                    self._reported_tables.append(fil_ind.table)
+                    self._reported_tables.add(fil_ind.table)
 
-    def _convert_parameters(self, temp_dir_path):
+    def _convert_parameters(self, zip_fl):
         # Workaround;
         # Developed for the EBA structure
-        output_path_parameters = temp_dir_path / "parameters.csv"
         parameters = {
             "entityID": self.instance.entity,
             "refPeriod": self.instance.period,
@@ -250,16 +276,16 @@ class Converter:
             "decimalsInteger": 0,
             "decimalsMonetary": (
                 self.instance.decimals_monetary
-                if self.instance.decimals_monetary
+                if self.instance.decimals_monetary is not None
                 else 0
             ),
             "decimalsPercentage": (
                 self.instance.decimals_percentage
-                if self.instance.decimals_percentage
+                if self.instance.decimals_percentage is not None
                 else 4
             ),
         }
-        with open(output_path_parameters, "w", newline="", encoding="utf-8") as fl:
+        with self._open_report_file(zip_fl, "parameters.csv") as fl:
             csv_writer = csv.writer(fl)
             csv_writer.writerow(["name", "value"])
             for k, v in parameters.items():
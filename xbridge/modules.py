@@ -38,6 +38,7 @@ class Module:
         self.taxonomy_code = taxonomy_code
         self.date = date
         self._tables = tables if tables is not None else []
+        self._tables_by_code = None
         self.taxonomy_module_path = None
 
     @property
@@ -45,10 +46,18 @@ class Module:
         """Returns the :obj:`tables <xbridge.taxonomy.Table>` defined in the JSON file for the :obj:`module <xbridge.taxonomy.Module>`"""
         return self._tables
 
+    @property
+    def tables_by_code(self):
+        """Returns a dictionary with the :obj:`tables <xbridge.taxonomy.Table>` of the :obj:`module <xbridge.taxonomy.Module>` by their code"""
+        if self._tables_by_code is None:
+            self._tables_by_code = {table.code: table for table in self.tables}
+        return self._tables_by_code
+
     def extract_tables(self, zip_file: ZipFile):
         """Extracts the :obj:`tables <xbridge.taxonomy.Table>` in the JSON files for the :obj:`modules <xbridge.taxonomy.Module>` in the taxonomy"""
 
         self._tables = []
+        self._tables_by_code = None
         bin_read = zip_file.read(self.taxonomy_module_path)
 
         info = json.loads(bin_read.decode("utf-8"))
@@ -74,10 +83,9 @@ class Module:
 
     def get_table(self, table_code: str):
         """Returns a :obj:`table <xbridge.taxonomy.Table>` object with the given code"""
-        for table in self.tables:
-            if table.code_name == table_code:
-                return table
-        raise ValueError(f"Table {table_code} not found in module {self.code}")
+        if table_code not in self.tables_by_code:
+            raise ValueError(f"Table {table_code} not found in module {self.code}")
+        return self.tables_by_code[table_code]
 
     def to_dict(self):
         """Returns a dictionary"""
@@ -188,6 +196,8 @@ class Table:
         self._variables = variables if variables is not None else []
         self._attributes = attributes if attributes is not None else []
         self._datapoint_df = None
+        self._metrics = None
+        self._table_json = None
 
     @property
     def open_keys(self):
@@ -221,6 +231,16 @@ class Table:
         """
         return self._datapoint_df
 
+    @property
+    def metrics(self):
+        """Returns the set of metrics used by the :obj:`variables <xbridge.taxonomy.Variable>` of the :obj:`table <xbridge.taxonomy.Table>`"""
+        if self._metrics is None:
+            if self.variable_df is not None and "metric" in self.variable_df.columns:
+                self._metrics = frozenset(self.variable_df["metric"].dropna())
+            else:
+                self._metrics = frozenset()
+        return self._metrics
+
     def generate_variable_df(self):
         """Returns a dataframe with the :obj:`variable <xbridge.taxonomy.Variable>` and extensional context"""
         variables = []
@@ -236,15 +256,21 @@ class Table:
             variable_info["datapoint"] = variable.code
             variables.append(copy.copy(variable_info))
         self._datapoint_df = pd.DataFrame(variables)
+        self._metrics = None
+
+    def _load_table_json(self, zip_file: ZipFile):
+        """Returns the JSON file of the :obj:`table <xbridge.taxonomy.Table>`, reading it only once"""
+        if self._table_json is None:
+            bin_read = zip_file.read(self.table_zip_path)
+            self._table_json = json.loads(bin_read.decode("utf-8"))
+        return self._table_json
 
     def extract_open_keys(self, zip_file: ZipFile):
         """Extracts the open keys for the :obj:`table <xbridge.taxonomy.Table>`"""
         self._open_keys = []
         self._attributes = []
 
-        bin_read = zip_file.read(self.table_zip_path)
-
-        table_json = json.loads(bin_read.decode("utf-8"))
+        table_json = self._load_table_json(zip_file)
         table_template = table_json["tableTemplates"][self.code]
         for column_name in table_template.get("columns", []):
             if column_name == "unit":
@@ -255,9 +281,8 @@ class Table:
     def extract_variables(self, zip_file: ZipFile):
         """Extract the :obj:`variable <xbridge.taxonomy.Variable>` for the :obj:`table <xbridge.taxonomy.Table>`"""
         self._variables = []
-        bin_read = zip_file.read(self.table_zip_path)
 
-        table_json = json.loads(bin_read.decode("utf-8"))
+        table_json = self._load_table_json(zip_file)
         if self.code in table_json["tableTemplates"]:
             variables_dict = table_json["tableTemplates"][self.code]["columns"][
                 "datapoint"
@@ -284,6 +309,8 @@ class Table:
 
         obj.extract_open_keys(zip_file)
         obj.extract_variables(zip_file)
+        # The table JSON is only needed during the extraction
+        obj._table_json = None
 
         # obj.generate_datapoint_df()
 
@@ -24,6 +24,20 @@ MODULES_FOLDER = Path(__file__).parent / "modules"
 INDEX_PATH = MODULES_FOLDER / "index.json"
 DIM_DOM_MAPPING_PATH = MODULES_FOLDER / "dim_dom_mapping.json"
 
+LINKBASE_NAMESPACES = {
+    'link': 'http://www.xbrl.org/2003/linkbase',
+    'xlink': 'http://www.w3.org/1999/xlink'}
+XLINK_LABEL = '{http://www.w3.org/1999/xlink}label'
+XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+XLINK_FROM = '{http://www.w3.org/1999/xlink}from'
+XLINK_TO = '{http://www.w3.org/1999/xlink}to'
+
+DIMENSION_DOMAIN_ARCS_XPATH = etree.XPath(
+    '//link:definitionArc[@xlink:arcrole="'
+    'http://xbrl.org/int/dim/arcrole/dimension-domain"]',
+    namespaces=LINKBASE_NAMESPACES)
+LOCATORS_XPATH = etree.XPath('//link:loc', namespaces=LINKBASE_NAMESPACES)
+
 
 def _extract_specific_files_7z(file_path: Path, target_path: Path):
     cmd = [shutil.which('7z'), 'x', f'-o{target_path}', file_path, '*.json', '*dim-def.xml', '-r']
@@ -56,23 +70,16 @@ class Taxonomy:
 
     @staticmethod
     def _get_dim_dom_mapping(root: etree) -> dict:
-        ns = {
-            'link': 'http://www.xbrl.org/2003/linkbase',
-            'xlink': 'http://www.w3.org/1999/xlink'}
-        arcroles = root.xpath(
-            '//link:definitionArc[@xlink:arcrole="'
-            'http://xbrl.org/int/dim/arcrole/dimension-domain"]',
-            namespaces=ns)
+        # Locators are indexed by label once, instead of searching the whole
+        # document for the two locators of every arc
+        hrefs = {}
+        for locator in LOCATORS_XPATH(root):
+            hrefs.setdefault(locator.get(XLINK_LABEL), locator.get(XLINK_HREF))
+
         map_dom_mapping = {}
-        for element in arcroles:
-            dim_locator = element.get('{http://www.w3.org/1999/xlink}from')
-            dim = root.xpath(f'//link:loc[@xlink:label = "{dim_locator}"]', namespaces=ns)[0]
-            dim = dim.get('{http://www.w3.org/1999/xlink}href'). \
-                split("#")[1]. \
-                split("_")[1]
-            dom_locator = element.get('{http://www.w3.org/1999/xlink}to')
-            dom = root.xpath(f'//link:loc[@xlink:label = "{dom_locator}"]', namespaces=ns)[0]
-            dom = dom.get('{http://www.w3.org/1999/xlink}href').split("#")[1]
+        for element in DIMENSION_DOMAIN_ARCS_XPATH(root):
+            dim = hrefs[element.get(XLINK_FROM)].split("#")[1].split("_")[1]
+            dom = hrefs[element.get(XLINK_TO)].split("#")[1]
             map_dom_mapping[dim] = dom
         return map_dom_mapping
 
@@ -2,21 +2,74 @@
     Module with the classes related to XBRL-XML instance files.
 """
 
+import sys
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
 import pandas as pd
 from lxml import etree
 
+XBRLI_NAMESPACE = "http://www.xbrl.org/2003/instance"
+FIND_NAMESPACE = "http://www.eurofiling.info/xbrl/ext/filing-indicators"
+
+XBRLI_CONTEXT = f"{{{XBRLI_NAMESPACE}}}context"
+XBRLI_ENTITY = f"{{{XBRLI_NAMESPACE}}}entity"
+XBRLI_IDENTIFIER = f"{{{XBRLI_NAMESPACE}}}identifier"
+XBRLI_PERIOD = f"{{{XBRLI_NAMESPACE}}}period"
+XBRLI_INSTANT = f"{{{XBRLI_NAMESPACE}}}instant"
+XBRLI_SCENARIO = f"{{{XBRLI_NAMESPACE}}}scenario"
+XBRLI_UNIT = f"{{{XBRLI_NAMESPACE}}}unit"
+XBRLI_MEASURE = f"{{{XBRLI_NAMESPACE}}}measure"
+FIND_FINDICATORS = f"{{{FIND_NAMESPACE}}}fIndicators"
+FIND_FILING_INDICATOR = f"{{{FIND_NAMESPACE}}}filingIndicator"
+FIND_FILED = f"{{{FIND_NAMESPACE}}}filed"
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+ENTITY_PREFIX_MAPPING = {
+    "https://eurofiling.info/eu/rs": "rs",
+    "http://standards.iso.org/iso/17442": "lei",
+}
+
+_parser_storage = threading.local()
+
+
+def _get_parser():
+    """Returns the XML parser for the instances, one per thread as lxml
+    parsers cannot be shared between threads. XBRL instances do not use
+    IDs nor entities, so neither of them is processed."""
+    parser = getattr(_parser_storage, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(
+            collect_ids=False, resolve_entities=False, no_network=True
+        )
+        _parser_storage.parser = parser
+    return parser
+
+
+def _intern(value):
+    """Returns the interned version of the string, or ``None`` if there is no value"""
+    return sys.intern(value) if value is not None else None
+
+
+def _max_decimals(decimals_values):
+    """Returns the highest numeric decimals value in the given collection,
+    ignoring missing and ``INF`` values. Returns ``None`` if there is none."""
+    values = [int(value) for value in decimals_values if value not in (None, "INF")]
+    return max(values) if values else None
+
 
 class Instance:
     """Class representing an XBRL XML instance file. Its attributes are the characters contained in the XBRL files.
     Each property returns one of these attributes.
 
-    :param path: File path to be used
+    :param path: File path to be used, or a binary file-like object with the XML content
 
     """
 
-    def __init__(self, path: str = None):
+    def __init__(self, path: str | Path | BinaryIO = None):
         self.path = path
-        self.root = etree.parse(self.path).getroot()
+        self.root = etree.parse(self.path, _get_parser()).getroot()
 
         self._facts_list_dict = None
         self._df = None
@@ -69,13 +122,18 @@ class Instance:
         """Generates a list of dictionaries with the `facts <https://www.xbrl.org/guidance/xbrl-glossary/#:~:text=accounting%20standards%20body.-,Fact,-A%20fact%20is>`_
         of the instance file."""
         result = []
+        # Many facts share the same context, so its dictionary is built only once
+        context_dicts = {}
         for fact in self.facts:
             fact_dict = fact.__dict__()
 
             context_id = fact_dict.pop("context")
 
             if context_id is not None:
-                context = self.contexts[context_id].__dict__()
+                context = context_dicts.get(context_id)
+                if context is None:
+                    context = self.contexts[context_id].__dict__()
+                    context_dicts[context_id] = context
                 fact_dict.update(context)
 
             result.append(fact_dict)
@@ -114,11 +172,7 @@ class Instance:
     @property
     def identifier_prefix(self):
         """Returns the identifier prefix of the instance file."""
-        entity_prefix_mapping = {
-            "https://eurofiling.info/eu/rs": "rs",
-            "http://standards.iso.org/iso/17442": "lei"}
-
-        return entity_prefix_mapping[self._identifier_prefix]
+        return ENTITY_PREFIX_MAPPING[self._identifier_prefix]
 
 
     @property
@@ -162,37 +216,34 @@ class Instance:
         """Extracts :obj:`Context <xbridge.xml_instance.Context>` from the XML instance file."""
 
         contexts = {}
-        for context in self.root.findall(
-            "{http://www.xbrl.org/2003/instance}context", self.namespaces
-        ):
+        for context in self.root.findall(XBRLI_CONTEXT, self.namespaces):
             context_object = Context(context)
             contexts[context_object.id] = context_object
 
         self._contexts = contexts
 
         self._identifier_prefix = self.root.find(
-            "{http://www.xbrl.org/2003/instance}context", self.namespaces
-        ).find("{http://www.xbrl.org/2003/instance}entity").\
-            find("{http://www.xbrl.org/2003/instance}identifier").\
-                attrib.get("scheme")
+            XBRLI_CONTEXT, self.namespaces
+        ).find(XBRLI_ENTITY).find(XBRLI_IDENTIFIER).attrib.get("scheme")
 
     def get_facts(self):
         """Extracts `facts <https://www.xbrl.org/guidance/xbrl-glossary/#:~:text=accounting%20standards%20body.-,Fact,-A%20fact%20is>`_
         from the XML instance file."""
         facts = []
+        # The prefix of the metrics namespace is resolved once for all the facts
+        facts_prefixes = list(self.root.nsmap.keys())[
+            list(self.root.nsmap.values()).index(
+                "http://www.eba.europa.eu/xbrl/crr/dict/met"
+            )
+        ]
         for child in self.root:
-            facts_prefixes = list(self.root.nsmap.keys())[
-                list(self.root.nsmap.values()).index(
-                    "http://www.eba.europa.eu/xbrl/crr/dict/met"
-                )
-            ]
             if child.prefix == facts_prefixes:
                 fact = Fact(child)
                 if fact.unit == self._base_currency_unit:
                     self._decimals_monetary_set.add(fact.decimals)
                 if fact.unit == self._pure_unit:
                     self._decimals_percentage_set.add(fact.decimals)
-                facts.append(Fact(child))
+                facts.append(fact)
 
         self._facts = facts
         self.get_facts_list_dict()
@@ -203,7 +254,7 @@ class Instance:
 
         for child in self.root:
             if child.prefix == "link":
-                value = child.attrib["{http://www.w3.org/1999/xlink}href"]
+                value = child.attrib[XLINK_HREF]
                 self._module_ref = value
                 value = value.split("/mod/")[1].split(".xsd")[0]
                 self._module_code = value
@@ -213,11 +264,7 @@ class Instance:
         """Extracts `filing <https://www.xbrl.org/guidance/xbrl-glossary/#2-other-terms-in-technical-or-common-use:~:text=data%20point.-,Filing,-The%20file%20or>`_
         indicators from the XML instance file."""
         filing_indicators = []
-        for fil_ind in self.root.find(
-            "{http://www.eurofiling.info/xbrl/ext/filing-indicators}fIndicators"
-        ).findall(
-            "{http://www.eurofiling.info/xbrl/ext/filing-indicators}filingIndicator"
-        ):
+        for fil_ind in self.root.find(FIND_FINDICATORS).findall(FIND_FILING_INDICATOR):
             filing_indicators.append(FilingIndicator(fil_ind))
 
         self._filing_indicators = filing_indicators
@@ -229,9 +276,9 @@ class Instance:
     def get_units(self):
         """Extracts the base currency of the instance"""
         units = {}
-        for unit in self.root.findall("{http://www.xbrl.org/2003/instance}unit"):
+        for unit in self.root.findall(XBRLI_UNIT):
             unit_name = unit.attrib["id"]
-            unit_value = unit.find("{http://www.xbrl.org/2003/instance}measure").text
+            unit_value = unit.find(XBRLI_MEASURE).text
             ##Workaround
             # We are assuming that currencies always start as iso4217
             if unit_value[:8].lower() == "iso4217:":
@@ -259,27 +306,19 @@ class Instance:
     @property
     def decimals_percentage(self):
         "Returns the single value for percentage values in the instance."
-        return (
-            max(self._decimals_percentage_set)
-            if len(self._decimals_percentage_set) > 0
-            else None
-        )
+        return _max_decimals(self._decimals_percentage_set)
 
     @property
     def decimals_monetary(self):
         "Returns the single value for monetary values in the instance."
-        max_reported = (
-            max(self._decimals_monetary_set)
-            if len(self._decimals_monetary_set) > 0
-            else None
-        )
-        if max_reported:
+        max_reported = _max_decimals(self._decimals_monetary_set)
+        if max_reported is not None:
             ##Workaround
             # We are assuming that the maximum number of decimals for monetary values
             # is 2, in practice. We found cases with higher numbers for some values,
             # and that causes problems in the CSV output, because the maximum was
             # applying.
-            return min(int(max_reported), 2)
+            return min(max_reported, 2)
         return None
 
 
@@ -364,21 +403,11 @@ class Context:
         """Parses the XML node with the :obj:`Context <xbridge.xml_instance.Context>`."""
         self._id = self.context_xml.attrib["id"]
 
-        self._entity = (
-            self.context_xml.find("{http://www.xbrl.org/2003/instance}entity")
-            .find("{http://www.xbrl.org/2003/instance}identifier")
-            .text
-        )
+        self._entity = self.context_xml.find(XBRLI_ENTITY).find(XBRLI_IDENTIFIER).text
 
-        self._period = (
-            self.context_xml.find("{http://www.xbrl.org/2003/instance}period")
-            .find("{http://www.xbrl.org/2003/instance}instant")
-            .text
-        )
+        self._period = self.context_xml.find(XBRLI_PERIOD).find(XBRLI_INSTANT).text
 
-        self._scenario = Scenario(
-            self.context_xml.find("{http://www.xbrl.org/2003/instance}scenario")
-        )
+        self._scenario = Scenario(self.context_xml.find(XBRLI_SCENARIO))
 
     def __repr__(self) -> str:
         return (
@@ -412,15 +441,17 @@ class Fact:
 
     def parse(self):
         """Parse the XML node with the `fact <https://www.xbrl.org/guidance/xbrl-glossary/#:~:text=accounting%20standards%20body.-,Fact,-A%20fact%20is>`_."""
-        self.metric = self.fact_xml.tag
+        # Metrics, decimals, contexts and units repeat across many facts, so
+        # they are interned to share a single string object for each value
+        self.metric = _intern(self.fact_xml.tag)
         self.value = self.fact_xml.text
-        self.decimals = self.fact_xml.attrib.get("decimals")
-        self.context = self.fact_xml.attrib.get("contextRef")
-        self.unit = self.fact_xml.attrib.get("unitRef")
+        self.decimals = _intern(self.fact_xml.attrib.get("decimals"))
+        self.context = _intern(self.fact_xml.attrib.get("contextRef"))
+        self.unit = _intern(self.fact_xml.attrib.get("unitRef"))
 
     def __dict__(self):
         return {
-            "metric": self.metric.split("}")[1],
+            "metric": sys.intern(self.metric.split("}")[1]),
             "value": self.value,
             "decimals": self.decimals,
             "context": self.context,
@@ -440,6 +471,8 @@ class FilingIndicator:
     :obj:`Context <xbridge.xml_instance.Context>`
     """
 
+    __slots__ = ("filing_indicator_xml", "value", "table", "context")
+
     def __init__(self, filing_indicator_xml):
         self.filing_indicator_xml = filing_indicator_xml
         self.value = None
@@ -450,9 +483,7 @@ class FilingIndicator:
 
     def parse(self):
         """Parse the XML node with the filing indicator."""
-        value = self.filing_indicator_xml.attrib.get(
-            "{http://www.eurofiling.info/xbrl/ext/filing-indicators}filed"
-        )
+        value = self.filing_indicator_xml.attrib.get(FIND_FILED)
         if value:
             self.value = True if value == "true" else False
         else: